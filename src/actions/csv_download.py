@@ -4,17 +4,134 @@ kai_system - CSVダウンロード + Excel転記 アクション
 旧 logic_robot.py の機能をプラグイン化
 """
 
+import functools
+import os
 import platform
 import time as time_module
 import webbrowser
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from core.action_base import ActionBase, ActionResult
 from core.action_manager import register_action
+from infra.excel_com import (
+    fast_mode, get_excel_app, open_workbook, read_csv_rows, save_if_dirty, write_rows,
+)
 from infra.logger import logger
 
 
+# ダウンロード待機のポーリング間隔（秒）: 短い間隔から指数的に伸ばす
+_POLL_MIN_DELAY = 0.05
+_POLL_MAX_DELAY = 1.0
+# ダウンロード要求より前からある CSV は対象外（時計の粒度・ずれの許容幅, 秒）
+_STALE_MARGIN = 2.0
+# サイズと更新時刻がこの秒数以上変わらなければ書き込み完了の候補とする
+_STABLE_SECONDS = 0.5
+
+
+@functools.lru_cache(maxsize=None)
+def _get_downloads_folder() -> Path:
+    """ダウンロードフォルダのパスを取得（初回のみ判定してキャッシュ）"""
+    downloads = Path(os.environ.get("USERPROFILE", "")) / "Downloads"
+    if not downloads.exists():
+        downloads = Path.home() / "Downloads"
+    return downloads
+
+
+def _open_change_notification(folder: Path) -> Any:
+    """フォルダの変更通知ハンドルを開く（pywin32 が無い環境では None）"""
+    try:
+        import win32con
+        import win32file
+    except ImportError:
+        return None
+    try:
+        return win32file.FindFirstChangeNotification(
+            str(folder),
+            False,
+            win32con.FILE_NOTIFY_CHANGE_FILE_NAME | win32con.FILE_NOTIFY_CHANGE_LAST_WRITE,
+        )
+    except Exception as e:
+        logger.warning(f"フォルダ監視を開始できません。ポーリングで待機します: {e}")
+        return None
+
+
+def _wait_for_change(handle: Any, seconds: float) -> None:
+    """フォルダに変更があるか指定秒数が経過するまで待機"""
+    import win32event
+    import win32file
+    if win32event.WaitForSingleObject(handle, int(seconds * 1000)) == win32event.WAIT_OBJECT_0:
+        win32file.FindNextChangeNotification(handle)
+
+
+def _close_change_notification(handle: Any) -> None:
+    """変更通知ハンドルを閉じる"""
+    if handle is not None:
+        import win32file
+        win32file.FindCloseChangeNotification(handle)
+
+
+def _scan_csv_files(folder: Path) -> List[os.DirEntry]:
+    """フォルダ直下の CSV ファイルを列挙（scandir 1回、拡張子は大小文字を区別しない）"""
+    try:
+        with os.scandir(folder) as it:
+            return [
+                e for e in it
+                if e.name.lower().endswith(".csv") and e.is_file()
+            ]
+    except OSError:
+        return []
+
+
+# LockFileEx でロックする範囲（ファイル全体）
+_LOCK_RANGE = 0xFFFFFFFF
+
+
+def _is_file_unlocked(path: str) -> bool:
+    """他プロセスが書き込み・ロック中でないか確認する
+
+    読み書き共有で開いたハンドルに LockFileEx を即時失敗モードでかけて判定する
+    （書き込み側と競合する書き込みモードでの open は行わない）。
+    pywin32 が無い環境では書き込みモードで開けるかで判定する。
+    """
+    try:
+        import pywintypes
+        import win32file
+        import winerror
+    except ImportError:
+        try:
+            with open(path, "r+b"):
+                return True
+        except OSError:
+            return False
+
+    try:
+        handle = win32file.CreateFile(
+            path,
+            win32file.GENERIC_READ,
+            win32file.FILE_SHARE_READ | win32file.FILE_SHARE_WRITE,
+            None,
+            win32file.OPEN_EXISTING,
+            0,
+            None,
+        )
+    except pywintypes.error:
+        # 共有違反（読み取りも許さない書き込み中）や削除済み
+        return False
+    try:
+        win32file.LockFileEx(
+            handle,
+            win32file.LOCKFILE_FAIL_IMMEDIATELY | win32file.LOCKFILE_EXCLUSIVE_LOCK,
+            _LOCK_RANGE, _LOCK_RANGE, pywintypes.OVERLAPPED(),
+        )
+        win32file.UnlockFileEx(handle, _LOCK_RANGE, _LOCK_RANGE, pywintypes.OVERLAPPED())
+        return True
+    except pywintypes.error as e:
+        return e.winerror != winerror.ERROR_LOCK_VIOLATION
+    finally:
+        handle.Close()
+
+
 @register_action
 class CSVDownloadAction(ActionBase):
     """CSVをダウンロードしてExcelに転記するアクション"""
@@ -54,18 +171,11 @@ class CSVDownloadAction(ActionBase):
                 error="Unsupported platform",
             )
 
-        self._notify_progress(f"開始: {file_name}", 0)
-
+        # 進捗通知は処理の区切りごとに1回（直後に次の通知が来る段階はまとめる）
         try:
-            # Windows COM 操作
-            import win32com.client
-
-            # Excel起動
-            self._notify_progress(f"Excel起動中: {file_name}", 10)
-            try:
-                excel_app = win32com.client.GetActiveObject("Excel.Application")
-            except Exception:
-                excel_app = win32com.client.Dispatch("Excel.Application")
+            # Excel起動（起動済みなら再利用）
+            self._notify_progress(f"Excel起動中: {file_name}", 0)
+            excel_app = get_excel_app()
 
             excel_app.Visible = True
             excel_app.DisplayAlerts = False
@@ -80,7 +190,9 @@ class CSVDownloadAction(ActionBase):
                     error="File not found",
                 )
 
-            workbook = excel_app.Workbooks.Open(
+            # 既に開いているブックは開き直さずに使う
+            workbook = open_workbook(
+                excel_app,
                 excel_path,
                 UpdateLinks=0,
                 ReadOnly=False,
@@ -90,13 +202,11 @@ class CSVDownloadAction(ActionBase):
             csv_path = None
 
             if not skip_download:
-                # ダウンロード
-                self._notify_progress(f"ダウンロード中: {file_name}", 40)
+                # ダウンロード開始 → 待機
+                self._notify_progress(f"ダウンロード待機中: {file_name}", 40)
+                requested_at = time_module.time()
                 webbrowser.open(url)
-
-                # ダウンロード待機
-                self._notify_progress(f"ダウンロード待機中: {file_name}", 50)
-                csv_path = self._wait_for_csv_download()
+                csv_path = self._wait_for_csv_download(since=requested_at)
 
                 if csv_path is None:
                     workbook.Close(SaveChanges=False)
@@ -106,19 +216,12 @@ class CSVDownloadAction(ActionBase):
                         error="Download timeout",
                     )
 
-                # データ転記
+                # データ転記（クリップボードを使わず2次元配列で一括代入）
                 self._notify_progress(f"データ転記中: {target_sheet}", 70)
-                csv_workbook = excel_app.Workbooks.Open(
-                    str(csv_path), Format=2, Local=True
-                )
-                csv_sheet = csv_workbook.Sheets(1)
-                csv_sheet.UsedRange.Copy()
-
-                target = workbook.Sheets(target_sheet)
-                target.Range("A1").PasteSpecial(Paste=-4163)  # xlPasteValues
-                excel_app.CutCopyMode = False
-
-                csv_workbook.Close(SaveChanges=False)
+                target = workbook.Worksheets(target_sheet)
+                rows = read_csv_rows(csv_path)
+                with fast_mode(excel_app):
+                    write_rows(target, rows)
 
                 # CSVを削除
                 try:
@@ -137,7 +240,7 @@ class CSVDownloadAction(ActionBase):
             # 保存処理
             if action_after == "SAVE":
                 self._notify_progress(f"保存中: {file_name}", 90)
-                workbook.Save()
+                save_if_dirty(workbook)
             elif action_after == "PAUSE":
                 # ユーザーに手動作業を促す
                 import ctypes
@@ -150,7 +253,7 @@ class CSVDownloadAction(ActionBase):
                     )
                 ctypes.windll.user32.MessageBoxW(None, popup_msg, "kai_system - 手動作業", 0x40)
                 try:
-                    workbook.Save()
+                    save_if_dirty(workbook)
                 except Exception:
                     pass
 
@@ -172,34 +275,63 @@ class CSVDownloadAction(ActionBase):
                 error=str(e),
             )
 
-    def _wait_for_csv_download(self, timeout: int = 60, max_retries: int = 3) -> Optional[Path]:
-        """ダウンロードフォルダを監視してCSVを取得"""
-        import os, glob
-
-        downloads = Path(os.environ.get("USERPROFILE", "")) / "Downloads"
-        if not downloads.exists():
-            downloads = Path.home() / "Downloads"
-
-        for attempt in range(max_retries):
-            if attempt > 0:
-                time_module.sleep(5)
-
-            start = time_module.time()
-            while time_module.time() - start < timeout:
-                if self._stop_requested:
+    def _wait_for_csv_download(
+        self, timeout: int = 60, max_retries: int = 3, since: Optional[float] = None
+    ) -> Optional[Path]:
+        """ダウンロードフォルダを監視してCSVを取得
+
+        since（省略時は呼び出し時刻）より前に更新された CSV は、
+        以前のダウンロードの残りとみなして無視する。
+        """
+        downloads = _get_downloads_folder()
+        if since is None:
+            since = time_module.time()
+        since_ns = int((since - _STALE_MARGIN) * 1_000_000_000)
+
+        # 毎秒の空ポーリングではなく、フォルダ変更通知で起こしてもらう
+        # （中断要求の確認のため最長 _POLL_MAX_DELAY 秒で一度戻る）
+        handle = _open_change_notification(downloads)
+        try:
+            for attempt in range(max_retries):
+                if attempt > 0 and self._sleep(5):
                     return None
 
-                pattern = str(downloads / "*.csv")
-                files = glob.glob(pattern)
-                for f in files:
-                    p = Path(f)
-                    if p.suffix.lower() == ".csv":
-                        # ロックチェック
+                delay = _POLL_MIN_DELAY
+                # 書き込み完了判定用: {パス: ((サイズ, 更新時刻), 初めてその値を観測した時刻)}
+                seen: Dict[str, Tuple[Tuple[int, int], float]] = {}
+                start = time_module.time()
+                while time_module.time() - start < timeout:
+                    if self._stop_requested:
+                        return None
+
+                    now = time_module.monotonic()
+                    for entry in _scan_csv_files(downloads):
+                        # サイズと更新時刻が _STABLE_SECONDS 以上変わらないファイルだけを
+                        # 最後に1回だけ open で確認する（ディレクトリ情報は遅れることがあるため）
                         try:
-                            with open(p, "r+b"):
-                                return p
-                        except (IOError, PermissionError):
-                            pass
-                time_module.sleep(1)
+                            st = entry.stat()
+                        except OSError:
+                            continue
+                        if st.st_mtime_ns < since_ns:
+                            continue
+                        signature = (st.st_size, st.st_mtime_ns)
+                        prev = seen.get(entry.path)
+                        if prev is None or prev[0] != signature:
+                            seen[entry.path] = (signature, now)
+                        elif (
+                            st.st_size > 0
+                            and now - prev[1] >= _STABLE_SECONDS
+                            and _is_file_unlocked(entry.path)
+                        ):
+                            return Path(entry.path)
+                        # 書き込み中のファイルがあれば短い間隔で再確認
+                        delay = _POLL_MIN_DELAY
+                    if handle is not None:
+                        _wait_for_change(handle, delay)
+                    else:
+                        self._sleep(delay)
+                    delay = min(delay * 1.5, _POLL_MAX_DELAY)
+        finally:
+            _close_change_notification(handle)
 
         return None
@@ -8,11 +8,17 @@ Mode: css_selector - URL + CSSセレクタ指定 (BeautifulSoup) - 認証不要
 Mode: browser_csv  - ブラウザ操作でCSVダウンロード (Playwright) - 認証+フォーム操作が必要
 """
 
+import io
+import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from core.action_base import ActionBase, ActionResult
 from core.action_manager import register_action
+from infra.excel_com import (
+    fast_mode, get_excel_app, open_workbook, read_csv_rows, save_if_dirty, write_rows,
+)
+from infra.http_client import HTTP_TIMEOUT, get_session
 from infra.logger import logger
 
 
@@ -81,18 +87,17 @@ class ScrapingAction(ActionBase):
     ) -> ActionResult:
         """pandas.read_html でHTMLテーブルを自動検出して取得"""
         import pandas as pd
-        import requests
 
         table_index = params.get("table_index", 0)
         output = params.get("output", "")
         output_sheet = params.get("output_sheet", "Sheet1")
 
         self._notify_progress("HTMLを取得中...", 20)
-        resp = requests.get(url, timeout=30)
+        resp = get_session().get(url, timeout=HTTP_TIMEOUT)
         resp.raise_for_status()
 
         self._notify_progress("テーブルを解析中...", 50)
-        tables = pd.read_html(resp.text)
+        tables = pd.read_html(io.StringIO(resp.text))
 
         if not tables:
             return ActionResult(
@@ -128,7 +133,6 @@ class ScrapingAction(ActionBase):
     ) -> ActionResult:
         """BeautifulSoup でCSSセレクタ指定の要素を抽出"""
         import pandas as pd
-        import requests
         from bs4 import BeautifulSoup
 
         selectors = params.get("selectors", {})
@@ -136,7 +140,7 @@ class ScrapingAction(ActionBase):
         output_sheet = params.get("output_sheet", "Sheet1")
 
         self._notify_progress("HTMLを取得中...", 20)
-        resp = requests.get(url, timeout=30)
+        resp = get_session().get(url, timeout=HTTP_TIMEOUT)
         resp.raise_for_status()
 
         self._notify_progress("要素を抽出中...", 50)
@@ -185,7 +189,6 @@ class ScrapingAction(ActionBase):
 
         前提: Chrome を --remote-debugging-port=9222 で起動済み
         """
-        import glob
         import time as time_module
         from playwright.sync_api import sync_playwright
 
@@ -234,7 +237,7 @@ class ScrapingAction(ActionBase):
                 page.wait_for_timeout(wait_after)
 
             # ダウンロード前のCSV一覧を記録
-            existing_csvs = set(glob.glob(str(Path(download_dir) / "*.csv")))
+            existing_csvs = self._list_csv_paths(download_dir)
 
             # CSVダウンロードボタンをクリック
             self._notify_progress("CSVダウンロードボタンをクリック...", 60)
@@ -282,7 +285,7 @@ class ScrapingAction(ActionBase):
                             success=False, message="中断されました", error="Cancelled"
                         )
 
-                    current_csvs = set(glob.glob(str(Path(download_dir) / "*.csv")))
+                    current_csvs = self._list_csv_paths(download_dir)
                     new_csvs = current_csvs - existing_csvs
                     if new_csvs:
                         new_file = list(new_csvs)[0]
@@ -300,7 +303,7 @@ class ScrapingAction(ActionBase):
                             data={"output": new_file},
                         )
 
-                    time_module.sleep(1)
+                    self._sleep(1)
 
                 page.close()
                 return ActionResult(
@@ -318,27 +321,27 @@ class ScrapingAction(ActionBase):
             shutil.copy(str(csv_path), excel_path)
             return excel_path
 
-        import win32com.client
         sheet_name = params.get("sheet_name", "Sheet1")
         try:
-            excel = win32com.client.Dispatch("Excel.Application")
+            # 転記ごとに Excel を新規起動せず、起動済みのインスタンスを再利用
+            excel = get_excel_app()
             excel.Visible = True
-            wb = excel.Workbooks.Open(str(Path(excel_path).absolute()))
-
-            csv_wb = excel.Workbooks.Open(str(csv_path.absolute()), Format=2, Local=True)
-            csv_wb.Sheets(1).UsedRange.Copy()
+            wb = open_workbook(excel, Path(excel_path).absolute())
 
+            # コレクションのプロキシは一度だけ取得（ワークシートに限定）
+            worksheets = wb.Worksheets
             try:
-                target_ws = wb.Sheets(sheet_name)
+                target_ws = worksheets(sheet_name)
             except Exception:
-                target_ws = wb.Sheets.Add()
+                target_ws = worksheets.Add()
                 target_ws.Name = sheet_name
 
-            target_ws.Range("A1").PasteSpecial(Paste=-4163)
-            excel.CutCopyMode = False
-            csv_wb.Close(False)
+            # クリップボードを使わず2次元配列で一括代入
+            rows = read_csv_rows(csv_path)
+            with fast_mode(excel):
+                write_rows(target_ws, rows)
 
-            wb.Save()
+            save_if_dirty(wb)
             return excel_path
         except Exception as e:
             logger.error(f"Excel転記失敗: {e}")
@@ -347,6 +350,15 @@ class ScrapingAction(ActionBase):
     # ----------------------------------------------------------------
     # ユーティリティ
     # ----------------------------------------------------------------
+    @staticmethod
+    def _list_csv_paths(folder: str) -> Set[str]:
+        """フォルダ直下の CSV パス集合を取得（glob ではなく scandir 1回で列挙）"""
+        try:
+            with os.scandir(folder) as it:
+                return {e.path for e in it if e.name.lower().endswith(".csv")}
+        except OSError:
+            return set()
+
     def _write_output(self, df, output: str, sheet_name: str) -> None:
         """DataFrameを出力ファイルに書き込む"""
         output_path = Path(output)
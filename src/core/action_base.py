@@ -4,6 +4,7 @@ kai_system - アクション基底クラス
 全てのアクションプラグインが継承する抽象基底クラス
 """
 
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -54,19 +55,34 @@ class ActionBase(ABC):
 
     def __init__(self):
         self._progress_callback: Optional[ProgressCallback] = None
-        self._stop_requested: bool = False
+        # 中断要求（待機中のスレッドを即座に起こせるよう Event で保持）
+        self._stop_event = threading.Event()
 
     def set_progress_callback(self, callback: ProgressCallback) -> None:
         """進捗コールバックを設定"""
         self._progress_callback = callback
 
+    @property
+    def _stop_requested(self) -> bool:
+        """中断が要求されているか"""
+        return self._stop_event.is_set()
+
     def request_stop(self) -> None:
         """中断リクエスト"""
-        self._stop_requested = True
+        self._stop_event.set()
 
     def reset(self) -> None:
         """状態リセット"""
-        self._stop_requested = False
+        self._stop_event.clear()
+
+    def _sleep(self, seconds: float) -> bool:
+        """
+        指定秒数待機する（中断要求があれば即座に戻る）
+
+        Returns:
+            中断が要求された場合 True
+        """
+        return self._stop_event.wait(seconds)
 
     def _notify_progress(self, message: str, percent: float = -1) -> None:
         """進捗を通知"""
@@ -102,8 +118,10 @@ class ActionBase(ABC):
     def execute_safe(self, params: Dict[str, Any]) -> ActionResult:
         """
         安全にアクションを実行する（例外キャッチ付き）
+
+        インスタンスは実行ごとに生成されるため、ここでは中断要求をクリアしない
+        （実行開始直前に届いた中断を取りこぼさないため）。
         """
-        self.reset()
         started = datetime.now()
         try:
             result = self.execute(params)
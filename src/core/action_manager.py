@@ -56,6 +56,7 @@ class ActionManager:
         self.config = config
         self._progress_callback: Optional[Callable] = None
         self.stop_requested = False
+        self._current_action: Optional[ActionBase] = None
         self.dt_from: Optional[datetime] = None
         self.dt_to: Optional[datetime] = None
         self.tz_mode: str = "jst"  # デフォルトTZ（アクション別に上書き）
@@ -65,20 +66,26 @@ class ActionManager:
         self._progress_callback = callback
 
     def request_stop(self) -> None:
-        """中断リクエスト"""
+        """中断リクエスト（実行中のアクションにも伝える）"""
         self.stop_requested = True
+        current = self._current_action
+        if current is not None:
+            current.request_stop()
 
     def _notify(self, message: str, current: int = 0, total: int = 0) -> None:
         """進捗を通知"""
         if self._progress_callback:
             self._progress_callback(current, total, message)
 
-    def run_action(self, action_config: ActionConfig) -> ActionResult:
+    def run_action(
+        self, action_config: ActionConfig, *, notify_start: bool = True
+    ) -> ActionResult:
         """
         単一アクションを実行する
 
         Args:
             action_config: 実行するアクションの設定
+            notify_start:  開始通知を送るか（呼び出し元が件数付きで通知済みなら False）
 
         Returns:
             ActionResult
@@ -118,9 +125,17 @@ class ActionManager:
 
         # 実行
         logger.info(f"アクション開始: [{action_config.id}] {action_config.name}")
-        self._notify(f"実行中: {action_config.name}")
-
-        result = action.execute_safe(resolved_params)
+        if notify_start:
+            self._notify(f"実行中: {action_config.name}")
+
+        self._current_action = action
+        # 公開前（インスタンス生成〜ここまで）に届いた中断要求を引き継ぐ
+        if self.stop_requested:
+            action.request_stop()
+        try:
+            result = action.execute_safe(resolved_params)
+        finally:
+            self._current_action = None
 
         if result.success:
             logger.success(
@@ -145,17 +160,21 @@ class ActionManager:
 
         return self.run_action(action_config)
 
-    def run_group(self, group_name: str) -> Dict[str, int]:
+    def run_group(
+        self, group_name: str, actions: Optional[List[ActionConfig]] = None
+    ) -> Dict[str, int]:
         """
         グループ内の全アクションを順次実行
 
         Args:
             group_name: グループ名
+            actions:    取得済みのアクション一覧（省略時はグループから取得）
 
         Returns:
             実行結果の辞書 {"success": int, "failed": int, "skipped": int}
         """
-        actions = self.config.get_actions_by_group(group_name)
+        if actions is None:
+            actions = self.config.get_actions_by_group(group_name)
         self.stop_requested = False
 
         results = {"success": 0, "failed": 0, "skipped": 0}
@@ -183,7 +202,7 @@ class ActionManager:
 
             self._notify(f"実行中 ({i}/{total}): {action_config.name}", i, total)
 
-            result = self.run_action(action_config)
+            result = self.run_action(action_config, notify_start=False)
 
             if result.success:
                 results["success"] += 1
@@ -4,8 +4,11 @@ kai_system - YAML設定管理モジュール
 actions.yaml / groups.yaml からタスク設定を読み込む
 """
 
+import functools
+import re
 import shutil
 import sys
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -14,7 +17,14 @@ import yaml
 
 from infra.logger import logger
 
+# libyaml (C実装) が使える環境では高速な CSafeLoader を使う
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
+# バックアップのタイムスタンプ形式 (YYYYMMDD_HHMMSS)
+_BACKUP_TS_RE = re.compile(r"^\d{8}_\d{6}$")
+
+
+@functools.lru_cache(maxsize=None)
 def _get_base_path() -> Path:
     """プロジェクトルートのパスを取得"""
     if getattr(sys, "frozen", False):
@@ -23,15 +33,45 @@ def _get_base_path() -> Path:
         return Path(__file__).parent.parent.parent
 
 
+# 文字列で書かれた真偽値の解釈表 ("false" 等の文字列を真とみなさないため)
+_BOOL_MAP: Dict[Any, bool] = {
+    True: True, "true": True, "yes": True, "on": True, "1": True,
+    False: False, "false": False, "no": False, "off": False, "0": False, "": False,
+}
+
+
+def _to_bool(value: Any) -> bool:
+    """YAML値を真偽値に変換する（null・解釈できない値は False）
+
+    キー省略時の既定値は呼び出し側で data.get(key, 既定値) として渡す。
+    """
+    if not isinstance(value, (bool, int, str)):
+        return False
+    key = value.strip().lower() if isinstance(value, str) else value
+    return _BOOL_MAP.get(key, False)
+
+
+def _to_str(value: Any, default: str = "") -> str:
+    """YAML値を文字列に変換する（文字列はそのまま返し、None は default）"""
+    if value is None:
+        return default
+    return value if type(value) is str else str(value)
+
+
 class ActionConfig:
     """個別アクションの設定を保持するクラス"""
 
+    __slots__ = (
+        "id", "name", "type", "group", "enabled", "timezone", "params",
+        "display_order", "icon", "webhook_url", "_raw",
+    )
+
     def __init__(self, data: Dict[str, Any]):
-        self.id: str = data.get("id", "")
-        self.name: str = data.get("name", "")
-        self.type: str = data.get("type", "")
-        self.group: str = data.get("group", "")
-        self.enabled: bool = data.get("enabled", True)
+        self.id: str = _to_str(data.get("id"))
+        self.name: str = _to_str(data.get("name"))
+        self.type: str = _to_str(data.get("type"))
+        self.group: str = _to_str(data.get("group"))
+        self.enabled: bool = _to_bool(data.get("enabled", True))
         self.timezone: str = data.get("timezone", "jst")  # "jst" or "utc"
         self.params: Dict[str, Any] = data.get("params", {})
         self.display_order: int = data.get("display_order", 999)
@@ -64,8 +104,10 @@ class ActionConfig:
 class GroupConfig:
     """グループの設定を保持するクラス"""
 
+    __slots__ = ("name", "display_order", "color", "icon", "_raw")
+
     def __init__(self, data: Dict[str, Any]):
-        self.name: str = data.get("name", "")
+        self.name: str = _to_str(data.get("name"))
         self.display_order: int = data.get("display_order", 999)
         self.color: str = data.get("color", "#4CAF50")
         self.icon: str = data.get("icon", "📁")
@@ -87,12 +129,17 @@ class GroupConfig:
 class WorkflowConfig:
     """ワークフロー (アクションの順次実行定義) を保持するクラス"""
 
+    __slots__ = (
+        "id", "name", "description", "action_ids", "stop_on_error",
+        "display_order", "icon",
+    )
+
     def __init__(self, data: Dict[str, Any]):
-        self.id: str = data.get("id", "")
-        self.name: str = data.get("name", "")
+        self.id: str = _to_str(data.get("id"))
+        self.name: str = _to_str(data.get("name"))
         self.description: str = data.get("description", "")
-        self.action_ids: List[str] = data.get("action_ids", [])
-        self.stop_on_error: bool = data.get("stop_on_error", True)
+        self.action_ids: List[str] = [_to_str(a) for a in data.get("action_ids") or []]
+        self.stop_on_error: bool = _to_bool(data.get("stop_on_error", True))
         self.display_order: int = data.get("display_order", 999)
         self.icon: str = data.get("icon", "&#9881;")
 
@@ -149,14 +196,9 @@ class ConfigManager:
 
     def _load_actions(self) -> None:
         """actions.yaml を読み込む"""
-        if not self.actions_file.exists():
-            logger.warning(f"アクション設定ファイルが見つかりません: {self.actions_file}")
-            self._actions = []
-            return
-
         try:
             with open(self.actions_file, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YamlLoader)
 
             if data and "actions" in data:
                 self._actions = [ActionConfig(a) for a in data["actions"]]
@@ -165,20 +207,18 @@ class ConfigManager:
             else:
                 self._actions = []
 
+        except FileNotFoundError:
+            logger.warning(f"アクション設定ファイルが見つかりません: {self.actions_file}")
+            self._actions = []
         except Exception as e:
             logger.error(f"アクション設定の読み込みエラー: {e}")
             self._actions = []
 
     def _load_groups(self) -> None:
         """groups.yaml を読み込む"""
-        if not self.groups_file.exists():
-            logger.warning(f"グループ設定ファイルが見つかりません: {self.groups_file}")
-            self._groups = []
-            return
-
         try:
             with open(self.groups_file, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YamlLoader)
 
             if data and "groups" in data:
                 self._groups = [GroupConfig(g) for g in data["groups"]]
@@ -186,6 +226,9 @@ class ConfigManager:
             else:
                 self._groups = []
 
+        except FileNotFoundError:
+            logger.warning(f"グループ設定ファイルが見つかりません: {self.groups_file}")
+            self._groups = []
         except Exception as e:
             logger.error(f"グループ設定の読み込みエラー: {e}")
             self._groups = []
@@ -203,14 +246,33 @@ class ConfigManager:
 
     def get_action_by_id(self, action_id: str) -> Optional[ActionConfig]:
         """IDでアクションを検索"""
-        for action in self.get_all_actions():
-            if action.id == action_id:
+        if not self._loaded:
+            self.load()
+        for action in self._actions:
+            if action.id == action_id and action.enabled:
                 return action
         return None
 
+    def get_actions_by_ids(self, action_ids: List[str]) -> List[ActionConfig]:
+        """ID一覧に対応するアクションを指定順で取得（存在しない・無効なIDは除外）"""
+        index: Dict[str, ActionConfig] = {}
+        for a in self.get_all_actions():
+            index.setdefault(a.id, a)
+        return [index[aid] for aid in action_ids if aid in index]
+
     def get_actions_by_group(self, group_name: str) -> List[ActionConfig]:
         """指定グループのアクション一覧を取得"""
-        return [a for a in self.get_all_actions() if a.group == group_name]
+        if not self._loaded:
+            self.load()
+        # 有効判定とグループ判定を1パスで行い、中間リストを作らない
+        return [a for a in self._actions if a.enabled and a.group == group_name]
+
+    def get_actions_grouped(self) -> Dict[str, List[ActionConfig]]:
+        """有効なアクションをグループ名ごとにまとめる（1パスで構築）"""
+        grouped: Dict[str, List[ActionConfig]] = defaultdict(list)
+        for a in self.get_all_actions():
+            grouped[a.group].append(a)
+        return grouped
 
     def get_groups(self) -> List[GroupConfig]:
         """グループ一覧を取得"""
@@ -232,17 +294,16 @@ class ConfigManager:
 
     def _load_workflows(self) -> None:
         """workflows.yaml を読み込む"""
-        if not self.workflows_file.exists():
-            self._workflows = []
-            return
         try:
             with open(self.workflows_file, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YamlLoader)
             if data and "workflows" in data:
                 self._workflows = [WorkflowConfig(w) for w in data["workflows"]]
                 self._workflows.sort(key=lambda w: w.display_order)
             else:
                 self._workflows = []
+        except FileNotFoundError:
+            self._workflows = []
         except Exception as e:
             logger.error(f"ワークフロー設定の読み込みエラー: {e}")
             self._workflows = []
@@ -266,7 +327,7 @@ class ConfigManager:
     def add_workflow(self, data: Dict[str, Any]) -> WorkflowConfig:
         if not self._loaded:
             self.load()
-        new_id = data.get("id", "")
+        new_id = _to_str(data.get("id"))
         if any(w.id == new_id for w in self._workflows):
             raise ValueError(f"ワークフローIDが重複しています: {new_id}")
         wf = WorkflowConfig(data)
@@ -279,7 +340,7 @@ class ConfigManager:
             self.load()
         for i, w in enumerate(self._workflows):
             if w.id == workflow_id:
-                new_id = data.get("id", workflow_id)
+                new_id = _to_str(data.get("id", workflow_id))
                 if new_id != workflow_id and any(x.id == new_id for x in self._workflows):
                     raise ValueError(f"ワークフローIDが重複しています: {new_id}")
                 data.setdefault("id", workflow_id)
@@ -359,7 +420,7 @@ class ConfigManager:
         if not self._loaded:
             self.load()
         # ID 重複チェック
-        new_id = data.get("id", "")
+        new_id = _to_str(data.get("id"))
         if any(a.id == new_id for a in self._actions):
             raise ValueError(f"ID が重複しています: {new_id}")
         action = ActionConfig(data)
@@ -374,7 +435,7 @@ class ConfigManager:
         for i, a in enumerate(self._actions):
             if a.id == action_id:
                 # ID 変更時の重複チェック
-                new_id = data.get("id", action_id)
+                new_id = _to_str(data.get("id", action_id))
                 if new_id != action_id and any(x.id == new_id for x in self._actions):
                     raise ValueError(f"ID が重複しています: {new_id}")
                 new_action = ActionConfig(data)
@@ -434,7 +495,7 @@ class ConfigManager:
         """グループを追加"""
         if not self._loaded:
             self.load()
-        new_name = data.get("name", "")
+        new_name = _to_str(data.get("name"))
         if any(g.name == new_name for g in self._groups):
             raise ValueError(f"グループ名が重複しています: {new_name}")
         group = GroupConfig(data)
@@ -448,7 +509,7 @@ class ConfigManager:
             self.load()
         for i, g in enumerate(self._groups):
             if g.name == group_name:
-                new_name = data.get("name", group_name)
+                new_name = _to_str(data.get("name", group_name))
                 if new_name != group_name and any(x.name == new_name for x in self._groups):
                     raise ValueError(f"グループ名が重複しています: {new_name}")
                 # グループ名変更時、所属アクションも更新
@@ -495,22 +556,20 @@ class ConfigManager:
         backup_dir = self.config_dir / "backups"
         if not backup_dir.exists():
             return []
-        # タイムスタンプを抽出してグループ化
+        # タイムスタンプを抽出して重複排除し、新しい順に並べる
         timestamps = set()
         for f in backup_dir.glob("*.yaml"):
             parts = f.stem.rsplit("_", 2)
             if len(parts) >= 3:
-                ts = f"{parts[-2]}_{parts[-1]}"
-                timestamps.add(ts)
-        result = []
-        for ts in sorted(timestamps, reverse=True):
-            result.append({"timestamp": ts, "label": ts.replace("_", " ")})
-        return result
+                timestamps.add(f"{parts[-2]}_{parts[-1]}")
+        return [
+            {"timestamp": ts, "label": ts.replace("_", " ")}
+            for ts in sorted(timestamps, reverse=True)
+        ]
 
     def restore_config(self, timestamp: str) -> None:
         """バックアップから復元"""
-        import re as _re
-        if not _re.match(r'^\d{8}_\d{6}$', timestamp):
+        if not _BACKUP_TS_RE.match(timestamp):
             raise ValueError(f"無効なタイムスタンプ形式です: {timestamp}")
         backup_dir = self.config_dir / "backups"
         restored = False
@@ -30,9 +30,10 @@ class GroupManager:
 
     def get_grouped_actions(self) -> Dict[str, List[ActionConfig]]:
         """全グループのアクションをグループ名でマッピング"""
+        grouped = self.config.get_actions_grouped()
         result: Dict[str, List[ActionConfig]] = {}
         for group in self.get_groups():
-            actions = self.get_group_actions(group.name)
+            actions = grouped.get(group.name)
             if actions:
                 result[group.name] = actions
         return result
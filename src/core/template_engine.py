@@ -5,6 +5,7 @@ kai_system - URL/文字列テンプレート変数の展開ユーティリティ
 """
 
 import calendar
+import re
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional
 
@@ -13,6 +14,9 @@ from typing import Any, Dict, Optional
 TZ_JST = timezone(timedelta(hours=9))
 TZ_UTC = timezone.utc
 
+# テンプレート変数のプレースホルダ {name}
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
 
 def _weeknum_sunday(d: datetime) -> int:
     """
@@ -180,10 +184,7 @@ def expand_template(
     if not text or "{" not in text:
         return text
     variables = get_template_variables(dt_from=dt_from, dt_to=dt_to, tz_mode=tz_mode)
-    result = text
-    for key, value in variables.items():
-        result = result.replace(f"{{{key}}}", value)
-    return result
+    return _substitute(text, variables)
 
 
 def expand_params(
@@ -193,21 +194,41 @@ def expand_params(
     tz_mode: str = "jst",
 ) -> Dict[str, Any]:
     """パラメータ辞書内の全文字列値に対してテンプレート展開を行う"""
-    return _expand_recursive(params, dt_from, dt_to, tz_mode)
+    # プレースホルダが1つも無ければ変数辞書の生成自体を省略する
+    if not _has_placeholder(params):
+        return _expand_recursive(params, {})
+    # 変数辞書は1回だけ生成し、全ての文字列で使い回す
+    variables = get_template_variables(dt_from=dt_from, dt_to=dt_to, tz_mode=tz_mode)
+    return _expand_recursive(params, variables)
 
 
-def _expand_recursive(
-    obj: Any,
-    dt_from: Optional[datetime] = None,
-    dt_to: Optional[datetime] = None,
-    tz_mode: str = "jst",
-) -> Any:
+def _has_placeholder(obj: Any) -> bool:
+    """文字列値のどこかに '{' を含むか"""
+    if isinstance(obj, str):
+        return "{" in obj
+    elif isinstance(obj, dict):
+        return any(_has_placeholder(v) for v in obj.values())
+    elif isinstance(obj, list):
+        return any(_has_placeholder(item) for item in obj)
+    else:
+        return False
+
+
+def _substitute(text: str, variables: Dict[str, str]) -> str:
+    """生成済みの変数辞書で文字列を置換"""
+    if not text or "{" not in text:
+        return text
+    # 1回の走査で置換（未定義の変数はそのまま残す）
+    return _PLACEHOLDER_RE.sub(lambda m: variables.get(m.group(1), m.group(0)), text)
+
+
+def _expand_recursive(obj: Any, variables: Dict[str, str]) -> Any:
     """再帰的にテンプレート展開"""
     if isinstance(obj, str):
-        return expand_template(obj, dt_from=dt_from, dt_to=dt_to, tz_mode=tz_mode)
+        return _substitute(obj, variables)
     elif isinstance(obj, dict):
-        return {k: _expand_recursive(v, dt_from, dt_to, tz_mode) for k, v in obj.items()}
+        return {k: _expand_recursive(v, variables) for k, v in obj.items()}
     elif isinstance(obj, list):
-        return [_expand_recursive(item, dt_from, dt_to, tz_mode) for item in obj]
+        return [_expand_recursive(item, variables) for item in obj]
     else:
         return obj
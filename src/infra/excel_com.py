@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+kai_system - Excel COM 操作ユーティリティ
+アクション間で共通の Excel インスタンス取得・転記処理を提供する (Windows専用)
+"""
+
+import csv
+import io
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, List, Tuple, Union
+
+from infra.logger import logger
+
+# CSV の文字コード候補（BOM付きUTF-8 / UTF-8 → Shift_JIS の順に試す）
+_CSV_ENCODINGS = ("utf-8-sig", "cp932")
+
+XL_CALCULATION_MANUAL = -4135
+
+# 一括転記中に停止する Application の設定 (プロパティ名, 転記中の値)
+_FAST_MODE_SETTINGS = (
+    ("ScreenUpdating", False),
+    ("EnableEvents", False),
+    ("Calculation", XL_CALCULATION_MANUAL),
+)
+
+
+def get_excel_app() -> Any:
+    """
+    起動中の Excel に接続する（無ければ新規起動）
+
+    Dispatch は呼ぶたびに Excel プロセスを新規起動するため、
+    まず GetActiveObject で既存インスタンスを再利用する。
+    取得したオブジェクトは gencache で事前バインディングに包み、
+    呼び出しごとの名前解決 (GetIDsOfNames) を省く。
+    """
+    import win32com.client
+
+    try:
+        app = win32com.client.GetActiveObject("Excel.Application")
+    except Exception:
+        app = win32com.client.Dispatch("Excel.Application")
+
+    try:
+        return win32com.client.gencache.EnsureDispatch(app)
+    except Exception as e:
+        # 型ライブラリのキャッシュ生成に失敗した場合は遅延バインディングのまま使う
+        logger.warning(f"Excel の事前バインディングに失敗しました: {e}")
+        return app
+
+
+def _normalize_path(path: Union[str, Path]) -> str:
+    """ブック同一判定用にパスを正規化（絶対パス・大小文字無視）"""
+    return os.path.normcase(os.path.abspath(str(path)))
+
+
+def open_workbook(app: Any, path: Union[str, Path], **kwargs: Any) -> Any:
+    """
+    ブックを開く（同じファイルが既に開かれていればそれを再利用する）
+
+    kwargs は Workbooks.Open にそのまま渡す。
+    """
+    key = _normalize_path(path)
+    for wb in app.Workbooks:
+        try:
+            if _normalize_path(wb.FullName) == key:
+                return wb
+        except Exception:
+            continue
+    return app.Workbooks.Open(str(path), **kwargs)
+
+
+def save_if_dirty(workbook: Any) -> bool:
+    """未保存の変更がある場合のみブックを保存する。保存したら True"""
+    if workbook.Saved:
+        return False
+    workbook.Save()
+    return True
+
+
+@contextmanager
+def fast_mode(app: Any) -> Iterator[Any]:
+    """
+    画面更新・イベント・自動計算を一時停止する（終了時に元の設定へ戻す）
+
+    ブックが開かれていないと Calculation は変更できないため、
+    設定できなかった項目は無視する。
+    """
+    saved = []
+    for name, value in _FAST_MODE_SETTINGS:
+        try:
+            original = getattr(app, name)
+            setattr(app, name, value)
+            saved.append((name, original))
+        except Exception:
+            pass
+    try:
+        yield app
+    finally:
+        for name, original in reversed(saved):
+            try:
+                setattr(app, name, original)
+            except Exception as e:
+                logger.warning(f"Excel の設定 {name} を復元できませんでした: {e}")
+
+
+def read_csv_rows(csv_path: Union[str, Path]) -> List[Tuple[str, ...]]:
+    """
+    CSV を読み込み、Range.Value2 に代入できる長方形の2次元タプルで返す
+
+    短い行は空文字で埋めて列数を揃える。
+    """
+    raw = Path(csv_path).read_bytes()
+    for encoding in _CSV_ENCODINGS:
+        try:
+            text = raw.decode(encoding)
+            break
+        except UnicodeDecodeError:
+            continue
+    else:
+        text = raw.decode(_CSV_ENCODINGS[-1], errors="replace")
+
+    rows = list(csv.reader(io.StringIO(text, newline="")))
+    if not rows:
+        return []
+    width = max(len(r) for r in rows)
+    return [tuple(r) + ("",) * (width - len(r)) for r in rows]
+
+
+def write_rows(sheet: Any, rows: List[Tuple[str, ...]], start_cell: str = "A1") -> None:
+    """2次元データをシートへ一括代入する（クリップボードを経由しない）"""
+    if not rows:
+        return
+    # Resize は事前バインディングでは GetResize になるため、両端セルで範囲を指定する
+    top = sheet.Range(start_cell)
+    row, col = top.Row, top.Column
+    last = sheet.Cells(row + len(rows) - 1, col + len(rows[0]) - 1)
+    # Value2 は日付・通貨型の変換を挟まないため Value より軽い
+    sheet.Range(sheet.Cells(row, col), last).Value2 = rows
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""
+kai_system - HTTP 取得ユーティリティ
+スクレーピングとプレビューで共通のリトライ付き HTTP セッションを提供する
+"""
+
+from typing import Any
+
+# HTTP 取得のタイムアウト (接続, 読み込み) 秒
+HTTP_TIMEOUT = (10, 30)
+
+_session = None
+
+
+def get_session() -> Any:
+    """リトライ付きの共有 HTTP セッションを取得（初回のみ生成し接続を再利用する）"""
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        # 再試行は主に 5xx 応答が対象。接続失敗は1回まで、読み込みタイムアウトは
+        # 再試行しない（応答しないサイトで同期リクエストが長時間ブロックされるのを防ぐ）
+        retry = Retry(
+            total=3, connect=1, read=0,
+            backoff_factor=1.0, status_forcelist=[500, 502, 503, 504],
+        )
+        adapter = HTTPAdapter(max_retries=retry)
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _session = session
+    return _session
@@ -4,13 +4,15 @@ kai_system - ログモジュール
 クロスプラットフォーム対応のログ出力を提供する
 """
 
+import functools
 import os
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
 
+@functools.lru_cache(maxsize=None)
 def _get_base_path() -> Path:
     """実行ファイルのベースパスを取得"""
     if getattr(sys, 'frozen', False):
@@ -19,9 +21,14 @@ def _get_base_path() -> Path:
         return Path(__file__).parent.parent.parent
 
 
+def _log_folder_path() -> Path:
+    """ログフォルダのパスを返す（フォルダの作成はしない）"""
+    return _get_base_path() / "logs"
+
+
 def get_log_folder() -> Path:
     """ログフォルダのパスを取得する"""
-    log_folder = _get_base_path() / "logs"
+    log_folder = _log_folder_path()
     log_folder.mkdir(exist_ok=True)
     return log_folder
 
@@ -35,17 +42,33 @@ class Logger:
     @property
     def log_file(self) -> Path:
         """今日のログファイルパスを取得"""
-        today = datetime.now().strftime("%Y%m%d")
-        return get_log_folder() / f"log_{today}.txt"
+        return self._log_file_for(datetime.now())
+
+    @staticmethod
+    def _log_file_for(now: datetime) -> Path:
+        """指定日時に対応するログファイルパスを取得"""
+        return _log_folder_path() / f"log_{now:%Y%m%d}.txt"
+
+    @staticmethod
+    def _append(log_file: Path, log_line: str) -> None:
+        """ログファイルに1行追記する"""
+        with open(log_file, "a", encoding="utf-8") as f:
+            f.write(log_line)
 
     def _write(self, level: str, message: str) -> None:
         """ログをファイルに書き込む"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_line = f"[{timestamp}] [{level}] {message}\n"
+        # 時刻は1回だけ取得し、タイムスタンプとファイル名で共有する（日付跨ぎでのズレ防止）
+        now = datetime.now()
+        log_line = f"[{now:%Y-%m-%d %H:%M:%S}] [{level}] {message}\n"
 
+        log_file = self._log_file_for(now)
         try:
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                f.write(log_line)
+            try:
+                self._append(log_file, log_line)
+            except FileNotFoundError:
+                # フォルダ未作成時のみ作成して再試行（毎回の mkdir を避ける）
+                log_file.parent.mkdir(exist_ok=True)
+                self._append(log_file, log_line)
         except Exception:
             pass  # ログ書き込み自体の失敗は黙殺
 
@@ -71,7 +94,7 @@ class Logger:
     def rotate_logs(self, max_days: int = 30) -> int:
         """古いログファイルを削除する。削除した件数を返す"""
         log_folder = get_log_folder()
-        cutoff = datetime.now() - __import__("datetime").timedelta(days=max_days)
+        cutoff = datetime.now() - timedelta(days=max_days)
         cutoff_str = cutoff.strftime("%Y%m%d")
         deleted = 0
         for f in log_folder.glob("log_*.txt"):
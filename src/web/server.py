@@ -14,7 +14,7 @@ import threading
 import webbrowser
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 from flask import Flask, Response, jsonify, render_template, request
@@ -24,10 +24,31 @@ from core.action_manager import ActionManager, registry
 from core.group_manager import GroupManager
 from core.template_engine import get_template_variables, TZ_JST
 from core.param_schema import PARAM_SCHEMAS, get_action_types, get_param_schema
+from infra.http_client import HTTP_TIMEOUT, get_session
 from infra.logger import logger, get_log_folder
 from infra.notifier import notify_webhook_task_complete
 
 
+# テンプレート変数の説明一覧（/api/template-variables 用の定数）
+_TEMPLATE_VARIABLE_DOCS = (
+    {"var": "{today}", "desc": "今日の日付 (YYYYMMDD)"},
+    {"var": "{today_jp}", "desc": "今日の日付 (YYYY年MM月DD日)"},
+    {"var": "{today_slash}", "desc": "今日の日付 (YYYY/MM/DD)"},
+    {"var": "{today_hyphen}", "desc": "今日の日付 (YYYY-MM-DD)"},
+    {"var": "{yesterday}", "desc": "昨日の日付 (YYYYMMDD)"},
+    {"var": "{yesterday_jp}", "desc": "昨日の日付 (YYYY年MM月DD日)"},
+    {"var": "{from_date}", "desc": "開始日 (YYYYMMDD)"},
+    {"var": "{from_date_jp}", "desc": "開始日 (YYYY年MM月DD日)"},
+    {"var": "{from_date_slash}", "desc": "開始日 (YYYY/MM/DD)"},
+    {"var": "{to_date}", "desc": "終了日 (YYYYMMDD)"},
+    {"var": "{to_date_jp}", "desc": "終了日 (YYYY年MM月DD日)"},
+    {"var": "{to_date_slash}", "desc": "終了日 (YYYY/MM/DD)"},
+    {"var": "{year}", "desc": "今年 (YYYY)"},
+    {"var": "{month}", "desc": "今月 (MM)"},
+    {"var": "{day}", "desc": "今日 (DD)"},
+)
+
+
 class WebServer:
     """Flask ベースの Web UI サーバー"""
 
@@ -56,6 +77,8 @@ class WebServer:
         # テンプレートディレクトリ
         self.templates_dir = Path(config.config_dir) / "templates"
         self.templates_dir.mkdir(exist_ok=True)
+        # 解析済みテンプレートのキャッシュ {パス: (mtime, データ)}
+        self._template_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
 
         # 実行履歴の永続化
         self.history_file = Path(config.config_dir) / "execution_history.json"
@@ -77,9 +100,10 @@ class WebServer:
         @app.route("/api/status")
         def api_status():
             groups = []
+            grouped = self.config.get_actions_grouped()
             for g in self.group_manager.get_groups():
                 actions = []
-                for a in self.group_manager.get_group_actions(g.name):
+                for a in grouped.get(g.name, []):
                     actions.append({
                         "id": a.id, "name": a.name, "type": a.type,
                         "icon": a.icon, "enabled": a.enabled,
@@ -115,6 +139,7 @@ class WebServer:
 
             dt_from, dt_to = self._parse_datetime_range(request.get_json(silent=True))
             self.running_task = action.name
+            self.action_manager.stop_requested = False
             tz_label = action.timezone.upper()
             period = self._format_period(dt_from, dt_to)
             self._add_history(f"=== {action.name} [{tz_label}] 開始 {period} ===", "info")
@@ -184,7 +209,8 @@ class WebServer:
                 try:
                     self.action_manager.dt_from = dt_from
                     self.action_manager.dt_to = dt_to
-                    results = self.action_manager.run_group(group_name)
+                    # 存在確認で取得済みの一覧をそのまま渡し、再取得を避ける
+                    results = self.action_manager.run_group(group_name, actions)
                     level = "success" if results["failed"] == 0 else "error"
                     self._add_history(
                         f"=== {group_name} 完了: 成功={results['success']}, "
@@ -334,8 +360,7 @@ class WebServer:
             templates = []
             for f in sorted(self.templates_dir.glob("*.yaml")):
                 try:
-                    with open(f, "r", encoding="utf-8") as fh:
-                        data = yaml.safe_load(fh) or {}
+                    data = self._read_template(f)
                     templates.append({
                         "id": f.stem,
                         "name": data.get("name", f.stem),
@@ -355,8 +380,7 @@ class WebServer:
             if not filepath.exists():
                 return jsonify({"error": "テンプレートが見つかりません"}), 404
             try:
-                with open(filepath, "r", encoding="utf-8") as f:
-                    data = yaml.safe_load(f) or {}
+                data = self._read_template(filepath)
                 return jsonify({
                     "id": template_id,
                     "name": data.get("name", template_id),
@@ -387,6 +411,7 @@ class WebServer:
             try:
                 with open(filepath, "w", encoding="utf-8") as f:
                     yaml.dump(template_data, f, allow_unicode=True, default_flow_style=False)
+                self._template_cache.pop(str(filepath), None)
                 return jsonify({"status": "ok", "id": safe_id})
             except Exception as e:
                 return jsonify({"error": str(e)}), 500
@@ -400,6 +425,7 @@ class WebServer:
                 return jsonify({"error": "テンプレートが見つかりません"}), 404
             try:
                 filepath.unlink()
+                self._template_cache.pop(str(filepath), None)
                 return jsonify({"status": "ok"})
             except Exception as e:
                 return jsonify({"error": str(e)}), 500
@@ -436,16 +462,15 @@ class WebServer:
 
             try:
                 import pandas as pd
-                import requests as http_requests
 
-                resp = http_requests.get(url, timeout=30)
+                resp = get_session().get(url, timeout=HTTP_TIMEOUT)
                 resp.raise_for_status()
 
                 if mode == "auto_table":
                     table_index = data.get("table_index", 0)
                     if not isinstance(table_index, int) or table_index < 0:
                         return jsonify({"error": "テーブルインデックスが無効です"}), 400
-                    tables = pd.read_html(resp.text)
+                    tables = pd.read_html(io.StringIO(resp.text))
                     if not tables:
                         return jsonify({"error": "ページ内に表（テーブル）が見つかりませんでした"}), 404
                     if table_index >= len(tables):
@@ -618,18 +643,15 @@ class WebServer:
             if not wf:
                 return jsonify({"error": f"ワークフローが見つかりません: {wf_id}"}), 404
 
-            # アクションの存在確認
-            actions = []
-            for aid in wf.action_ids:
-                a = self.config.get_action_by_id(aid)
-                if a:
-                    actions.append(a)
+            # アクションの存在確認（ID索引を1回だけ構築して解決）
+            actions = self.config.get_actions_by_ids(wf.action_ids)
 
             if not actions:
                 return jsonify({"error": "ワークフローに有効なアクションがありません"}), 400
 
             dt_from, dt_to = self._parse_datetime_range(request.get_json(silent=True))
             self.running_task = f"WF: {wf.name}"
+            self.action_manager.stop_requested = False
             self._add_history(f"=== ワークフロー「{wf.name}」開始 ({len(actions)}件) ===", "info")
             self._broadcast_sse("execution_start", {"action": wf.name, "type": "workflow"})
 
@@ -639,6 +661,9 @@ class WebServer:
                     self.action_manager.dt_from = dt_from
                     self.action_manager.dt_to = dt_to
                     for i, action in enumerate(actions, 1):
+                        if self.action_manager.stop_requested:
+                            self._add_history("  ユーザーによりワークフローを中断しました", "warning")
+                            break
                         if not action.enabled:
                             results["skipped"] += 1
                             continue
@@ -647,7 +672,7 @@ class WebServer:
                             "message": f"({i}/{len(actions)}) {action.name}",
                             "current": i, "total": len(actions),
                         })
-                        result = self.action_manager.run_action(action)
+                        result = self.action_manager.run_action(action, notify_start=False)
                         if result.success:
                             results["success"] += 1
                             self._add_history(f"  {action.name}: 完了 ({result.elapsed_str})", "success")
@@ -964,24 +989,7 @@ class WebServer:
         @app.route("/api/template-variables")
         def api_template_variables():
             """利用可能なテンプレート変数の一覧"""
-            variables = [
-                {"var": "{today}", "desc": "今日の日付 (YYYYMMDD)"},
-                {"var": "{today_jp}", "desc": "今日の日付 (YYYY年MM月DD日)"},
-                {"var": "{today_slash}", "desc": "今日の日付 (YYYY/MM/DD)"},
-                {"var": "{today_hyphen}", "desc": "今日の日付 (YYYY-MM-DD)"},
-                {"var": "{yesterday}", "desc": "昨日の日付 (YYYYMMDD)"},
-                {"var": "{yesterday_jp}", "desc": "昨日の日付 (YYYY年MM月DD日)"},
-                {"var": "{from_date}", "desc": "開始日 (YYYYMMDD)"},
-                {"var": "{from_date_jp}", "desc": "開始日 (YYYY年MM月DD日)"},
-                {"var": "{from_date_slash}", "desc": "開始日 (YYYY/MM/DD)"},
-                {"var": "{to_date}", "desc": "終了日 (YYYYMMDD)"},
-                {"var": "{to_date_jp}", "desc": "終了日 (YYYY年MM月DD日)"},
-                {"var": "{to_date_slash}", "desc": "終了日 (YYYY/MM/DD)"},
-                {"var": "{year}", "desc": "今年 (YYYY)"},
-                {"var": "{month}", "desc": "今月 (MM)"},
-                {"var": "{day}", "desc": "今日 (DD)"},
-            ]
-            return jsonify({"variables": variables})
+            return jsonify({"variables": list(_TEMPLATE_VARIABLE_DOCS)})
 
         # ──────── 実行履歴詳細API ────────
 
@@ -1047,6 +1055,19 @@ class WebServer:
         except queue.Full:
             pass
 
+    def _read_template(self, path: Path) -> Dict[str, Any]:
+        """テンプレートYAMLを読み込む（更新時刻とサイズが変わらない限りキャッシュを返す）"""
+        st = path.stat()
+        signature = (st.st_mtime_ns, st.st_size)
+        key = str(path)
+        cached = self._template_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        with open(path, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f) or {}
+        self._template_cache[key] = (signature, data)
+        return data
+
     def _parse_datetime_range(self, data) -> tuple:
         if not data:
             return None, None
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""ActionManager 単体テスト"""
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+import actions.shell_cmd  # noqa: F401
+from core.action_base import ActionBase, ActionResult
+from core.action_manager import ActionManager, registry
+from core.config_manager import ActionConfig
+
+
+class _WaitAction(ActionBase):
+    """中断されるまで待機するテスト用アクション"""
+
+    ACTION_TYPE = "_test_wait"
+
+    def validate_params(self, params):
+        return []
+
+    def execute(self, params):
+        stopped = self._sleep(params.get("seconds", 10))
+        return ActionResult(success=not stopped, message="stopped" if stopped else "done")
+
+
+def _shell_action(action_id: str) -> ActionConfig:
+    return ActionConfig({
+        "id": action_id, "name": action_id, "type": "shell_cmd", "group": "G1",
+        "params": {"command": "echo ok"},
+    })
+
+
+@pytest.fixture
+def wait_action_type(monkeypatch):
+    """テスト用アクションをこのテストの間だけレジストリに登録"""
+    monkeypatch.setitem(registry._registry, _WaitAction.ACTION_TYPE, _WaitAction)
+
+
+@pytest.fixture
+def manager():
+    class _Config:
+        """get_actions_by_group の呼び出しを記録するだけの設定スタブ"""
+        def __init__(self):
+            self.lookups = 0
+
+        def get_actions_by_group(self, group_name):
+            self.lookups += 1
+            return [_shell_action("a1")]
+
+    with patch("core.action_manager.notify_task_complete"):
+        yield ActionManager(_Config())
+
+
+class TestRunGroup:
+
+    def test_run_group_looks_up_actions(self, manager):
+        results = manager.run_group("G1")
+        assert results == {"success": 1, "failed": 0, "skipped": 0}
+        assert manager.config.lookups == 1
+
+    def test_run_group_with_resolved_actions(self, manager):
+        actions = [_shell_action("a1"), _shell_action("a2")]
+        results = manager.run_group("G1", actions)
+        assert results["success"] == 2
+        assert manager.config.lookups == 0
+
+    def test_run_group_notifies_start_once_per_action(self, manager):
+        calls = []
+        manager.set_progress_callback(lambda cur, total, msg: calls.append((cur, total, msg)))
+        manager.run_group("G1", [_shell_action("a1")])
+        starts = [c for c in calls if c[2].startswith("実行中")]
+        assert starts == [(1, 1, "実行中 (1/1): a1")]
+
+
+class TestStop:
+
+    def test_request_stop_interrupts_running_action(self, manager, wait_action_type):
+        config = ActionConfig({"id": "w", "name": "w", "type": "_test_wait", "params": {"seconds": 10}})
+        results = []
+        worker = threading.Thread(target=lambda: results.append(manager.run_action(config)))
+        worker.start()
+        time.sleep(0.1)
+        manager.request_stop()
+        worker.join(5)
+        assert not worker.is_alive()
+        assert results and results[0].message == "stopped"
+
+    def test_pending_stop_is_forwarded(self, manager, wait_action_type):
+        config = ActionConfig({"id": "w", "name": "w", "type": "_test_wait", "params": {"seconds": 10}})
+        manager.stop_requested = True  # アクション公開前に届いた中断
+        assert manager.run_action(config).message == "stopped"
+
+    def test_stop_before_execute_is_kept(self):
+        action = _WaitAction()
+        action.request_stop()
+        assert action.execute_safe({"seconds": 10}).message == "stopped"
+
+    def test_sleep_without_stop(self):
+        action = _WaitAction()
+        assert action._sleep(0.01) is False
+        action.request_stop()
+        assert action._stop_requested is True
+        action.reset()
+        assert action._stop_requested is False
@@ -50,9 +50,22 @@ class TestLoadAndQuery:
         assert a is not None
         assert a.name == "Action1"
 
+    def test_get_action_by_id_disabled(self, tmp_config):
+        assert tmp_config.get_action_by_id("a2") is None
+
     def test_get_action_by_id_not_found(self, tmp_config):
         assert tmp_config.get_action_by_id("nonexistent") is None
 
+    def test_get_actions_by_ids(self, tmp_config):
+        actions = tmp_config.get_actions_by_ids(["nonexistent", "a1", "a2", "a1"])
+        assert [a.id for a in actions] == ["a1", "a1"]  # 指定順・a2 は無効
+
+    def test_workflow_numeric_action_ids(self, tmp_config):
+        tmp_config.add_action({"id": 101, "name": "Num", "type": "shell_cmd", "params": {}})
+        wf = tmp_config.add_workflow({"id": "wf", "name": "WF", "action_ids": [101, "a1"]})
+        assert wf.action_ids == ["101", "a1"]
+        assert [a.id for a in tmp_config.get_actions_by_ids(wf.action_ids)] == ["101", "a1"]
+
     def test_get_groups(self, tmp_config):
         groups = tmp_config.get_groups()
         assert len(groups) == 1
@@ -62,6 +75,11 @@ class TestLoadAndQuery:
         actions = tmp_config.get_actions_by_group("G1")
         assert len(actions) == 1  # a2 is disabled
 
+    def test_get_actions_grouped(self, tmp_config):
+        grouped = tmp_config.get_actions_grouped()
+        assert [a.id for a in grouped["G1"]] == ["a1"]  # a2 is disabled
+        assert grouped.get("missing", []) == []
+
     def test_get_ungrouped_actions(self, tmp_config):
         ungrouped = tmp_config.get_ungrouped_actions()
         assert len(ungrouped) == 0
@@ -80,6 +98,13 @@ class TestActionCRUD:
         with pytest.raises(ValueError, match="重複"):
             tmp_config.add_action(data)
 
+    def test_add_numeric_duplicate_action_raises(self, tmp_config):
+        tmp_config.add_action({"id": 101, "name": "Num", "type": "shell_cmd", "params": {}})
+        with pytest.raises(ValueError, match="重複"):
+            tmp_config.add_action({"id": 101, "name": "Num2", "type": "shell_cmd", "params": {}})
+        with pytest.raises(ValueError, match="重複"):
+            tmp_config.update_action("a1", {"id": 101, "name": "X", "type": "shell_cmd"})
+
     def test_update_action(self, tmp_config):
         updated = tmp_config.update_action("a1", {
             "id": "a1", "name": "Updated", "type": "shell_cmd", "params": {}
@@ -118,6 +143,11 @@ class TestGroupCRUD:
         with pytest.raises(ValueError, match="重複"):
             tmp_config.add_group({"name": "G1"})
 
+    def test_add_numeric_duplicate_group_raises(self, tmp_config):
+        tmp_config.add_group({"name": 2024})
+        with pytest.raises(ValueError, match="重複"):
+            tmp_config.add_group({"name": 2024})
+
     def test_update_group(self, tmp_config):
         g = tmp_config.update_group("G1", {"name": "G1_new", "display_order": 1})
         assert g.name == "G1_new"
@@ -141,6 +171,11 @@ class TestWorkflowCRUD:
         with pytest.raises(ValueError, match="重複"):
             tmp_config.add_workflow({"id": "wf1", "name": "WF2"})
 
+    def test_add_numeric_duplicate_workflow_raises(self, tmp_config):
+        tmp_config.add_workflow({"id": 7, "name": "WF"})
+        with pytest.raises(ValueError, match="重複"):
+            tmp_config.add_workflow({"id": "7", "name": "WF2"})
+
     def test_update_workflow(self, tmp_config):
         tmp_config.add_workflow({"id": "wf1", "name": "WF"})
         w = tmp_config.update_workflow("wf1", {"name": "Updated"})
@@ -172,6 +207,12 @@ class TestBackup:
         backups = tmp_config.list_backups()
         assert len(backups) >= 1
 
+    def test_list_backups_dedupes_files(self, tmp_config):
+        ts = tmp_config.backup_config()
+        backups = [b for b in tmp_config.list_backups() if b["timestamp"] == ts]
+        assert len(backups) == 1  # actions/groups の2ファイルで1件
+        assert backups[0]["label"] == ts.replace("_", " ")
+
     def test_restore_invalid_timestamp(self, tmp_config):
         with pytest.raises(ValueError, match="無効"):
             tmp_config.restore_config("../evil")
@@ -195,3 +236,23 @@ class TestDataClasses:
         d = w.to_dict()
         assert d["id"] == "w1"
         assert d["action_ids"] == ["a1"]
+
+    def test_string_false_is_not_enabled(self):
+        assert ActionConfig({"id": "x", "enabled": "false"}).enabled is False
+        assert ActionConfig({"id": "x", "enabled": "TRUE"}).enabled is True
+        assert ActionConfig({"id": "x"}).enabled is True
+
+    def test_numeric_yaml_ids_become_strings(self):
+        a = ActionConfig({"id": 123, "name": None, "group": 2024})
+        assert (a.id, a.name, a.group) == ("123", "", "2024")
+        assert GroupConfig({"name": 2024}).name == "2024"
+        assert WorkflowConfig({"id": 7}).id == "7"
+
+    def test_null_or_unknown_enabled_is_false(self):
+        assert ActionConfig({"id": "x", "enabled": None}).enabled is False
+        assert ActionConfig({"id": "x", "enabled": "disabled"}).enabled is False
+        assert ActionConfig({"id": "x", "enabled": [False]}).enabled is False
+
+    def test_workflow_stop_on_error_string(self):
+        w = WorkflowConfig({"id": "wf", "stop_on_error": "False"})
+        assert w.stop_on_error is False
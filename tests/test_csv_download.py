@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""csv_download.py のユニットテスト"""
+import os
+import sys
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from actions import csv_download
+from actions.csv_download import (
+    CSVDownloadAction, _get_downloads_folder, _is_file_unlocked, _scan_csv_files,
+)
+
+
+@pytest.fixture
+def downloads(tmp_path, monkeypatch):
+    """USERPROFILE を一時ディレクトリに向けた Downloads フォルダ"""
+    folder = tmp_path / "Downloads"
+    folder.mkdir()
+    monkeypatch.setenv("USERPROFILE", str(tmp_path))
+    _get_downloads_folder.cache_clear()
+    yield folder
+    _get_downloads_folder.cache_clear()
+
+
+class TestScanCsvFiles:
+
+    def test_filters_csv_case_insensitive(self, tmp_path):
+        (tmp_path / "a.csv").write_text("x")
+        (tmp_path / "B.CSV").write_text("x")
+        (tmp_path / "c.csv.crdownload").write_text("x")
+        (tmp_path / "d.txt").write_text("x")
+        (tmp_path / "sub.csv").mkdir()
+        names = sorted(e.name for e in _scan_csv_files(tmp_path))
+        assert names == ["B.CSV", "a.csv"]
+
+    def test_missing_folder(self, tmp_path):
+        assert _scan_csv_files(tmp_path / "missing") == []
+
+
+class _FakeWinError(Exception):
+    def __init__(self, winerror):
+        super().__init__(winerror)
+        self.winerror = winerror
+
+
+@pytest.fixture
+def fake_pywin32(monkeypatch):
+    """LockFileEx の結果を差し替えられる pywin32 の代役"""
+    handle = MagicMock()
+    win32file = MagicMock()
+    win32file.CreateFile.return_value = handle
+    monkeypatch.setitem(sys.modules, "pywintypes",
+                        SimpleNamespace(error=_FakeWinError, OVERLAPPED=object))
+    monkeypatch.setitem(sys.modules, "win32file", win32file)
+    monkeypatch.setitem(sys.modules, "winerror", SimpleNamespace(ERROR_LOCK_VIOLATION=33))
+    return win32file, handle
+
+
+class TestIsFileUnlocked:
+
+    def test_fallback_without_pywin32(self, tmp_path, monkeypatch):
+        monkeypatch.setitem(sys.modules, "pywintypes", None)
+        path = tmp_path / "a.csv"
+        path.write_text("a\n")
+        assert _is_file_unlocked(str(path)) is True
+        assert _is_file_unlocked(str(tmp_path / "missing.csv")) is False
+
+    def test_lock_acquired(self, fake_pywin32):
+        win32file, handle = fake_pywin32
+        assert _is_file_unlocked("a.csv") is True
+        win32file.UnlockFileEx.assert_called_once()
+        handle.Close.assert_called_once()
+
+    def test_lock_violation(self, fake_pywin32):
+        win32file, handle = fake_pywin32
+        win32file.LockFileEx.side_effect = _FakeWinError(33)
+        assert _is_file_unlocked("a.csv") is False
+        handle.Close.assert_called_once()
+
+    def test_sharing_violation_on_open(self, fake_pywin32):
+        win32file, _ = fake_pywin32
+        win32file.CreateFile.side_effect = _FakeWinError(32)
+        assert _is_file_unlocked("a.csv") is False
+
+
+class TestWaitForCsvDownload:
+
+    def test_returns_existing_csv(self, downloads):
+        csv_file = downloads / "report.csv"
+        csv_file.write_text("a,b\n1,2\n")
+        action = CSVDownloadAction()
+        assert action._wait_for_csv_download(timeout=2, max_retries=1) == csv_file
+
+    def test_detects_new_csv(self, downloads):
+        csv_file = downloads / "late.csv"
+        threading.Timer(0.1, csv_file.write_text, args=("a\n",)).start()
+        action = CSVDownloadAction()
+        assert action._wait_for_csv_download(timeout=5, max_retries=1) == csv_file
+
+    def test_waits_for_stable_window(self, downloads):
+        (downloads / "report.csv").write_text("a\n")
+        action = CSVDownloadAction()
+        started = time.monotonic()
+        assert action._wait_for_csv_download(timeout=5, max_retries=1) is not None
+        assert time.monotonic() - started >= csv_download._STABLE_SECONDS
+
+    def test_ignores_locked_csv(self, downloads, monkeypatch):
+        (downloads / "writing.csv").write_text("a\n")
+        monkeypatch.setattr(csv_download, "_is_file_unlocked", lambda path: False)
+        action = CSVDownloadAction()
+        assert action._wait_for_csv_download(timeout=1, max_retries=1) is None
+
+    def test_ignores_stale_csv(self, downloads):
+        stale = downloads / "old.csv"
+        stale.write_text("a\n")
+        old = time.time() - 3600
+        os.utime(stale, (old, old))
+        action = CSVDownloadAction()
+        assert action._wait_for_csv_download(timeout=0.3, max_retries=1) is None
+
+    def test_ignores_empty_file(self, downloads):
+        (downloads / "empty.csv").write_bytes(b"")
+        action = CSVDownloadAction()
+        assert action._wait_for_csv_download(timeout=0.3, max_retries=1) is None
+
+    def test_stop_requested(self, downloads):
+        action = CSVDownloadAction()
+        action.request_stop()
+        assert action._wait_for_csv_download(timeout=2, max_retries=1) is None
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""excel_com.py のユニットテスト（COM を使わない部分）"""
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from infra.excel_com import (
+    XL_CALCULATION_MANUAL, fast_mode, open_workbook, read_csv_rows, save_if_dirty,
+    write_rows,
+)
+
+
+class TestReadCsvRows:
+
+    def test_utf8_bom_and_padding(self, tmp_path):
+        p = tmp_path / "a.csv"
+        p.write_bytes("名前,値,備考\n山田,1\n".encode("utf-8-sig"))
+        assert read_csv_rows(p) == [("名前", "値", "備考"), ("山田", "1", "")]
+
+    def test_cp932(self, tmp_path):
+        p = tmp_path / "b.csv"
+        p.write_bytes("日付,件数\r\n2026/02/23,5\r\n".encode("cp932"))
+        assert read_csv_rows(p) == [("日付", "件数"), ("2026/02/23", "5")]
+
+    def test_quoted_newline(self, tmp_path):
+        p = tmp_path / "c.csv"
+        p.write_text('a,"x\ny"\n', encoding="utf-8")
+        assert read_csv_rows(p) == [("a", "x\ny")]
+
+    def test_empty(self, tmp_path):
+        p = tmp_path / "d.csv"
+        p.write_bytes(b"")
+        assert read_csv_rows(p) == []
+
+
+class TestWriteRows:
+
+    def test_assigns_cell_bounded_range(self):
+        sheet = MagicMock()
+        sheet.Range.return_value.Row = 2
+        sheet.Range.return_value.Column = 3
+        sheet.Cells.side_effect = lambda r, c: (r, c)
+        rows = [("a", "b"), ("1", "2"), ("3", "4")]
+        write_rows(sheet, rows, "C2")
+        assert sheet.Range.call_args_list[0].args == ("C2",)
+        assert sheet.Range.call_args_list[1].args == ((2, 3), (4, 4))
+        assert sheet.Range.return_value.Value2 == rows
+
+    def test_empty_is_noop(self):
+        sheet = MagicMock()
+        write_rows(sheet, [])
+        sheet.Range.assert_not_called()
+
+
+class TestFastMode:
+
+    def _app(self):
+        return SimpleNamespace(ScreenUpdating=True, EnableEvents=True, Calculation=-4105)
+
+    def test_settings_suspended_and_restored(self):
+        app = self._app()
+        with fast_mode(app):
+            assert app.ScreenUpdating is False
+            assert app.EnableEvents is False
+            assert app.Calculation == XL_CALCULATION_MANUAL
+        assert (app.ScreenUpdating, app.EnableEvents, app.Calculation) == (True, True, -4105)
+
+    def test_restored_on_error(self):
+        app = self._app()
+        with pytest.raises(RuntimeError):
+            with fast_mode(app):
+                raise RuntimeError("boom")
+        assert app.ScreenUpdating is True
+        assert app.Calculation == -4105
+
+    def test_unsupported_setting_is_skipped(self):
+        app = SimpleNamespace(ScreenUpdating=True)  # 他の設定は取得できない
+        with fast_mode(app):
+            assert app.ScreenUpdating is False
+        assert app.ScreenUpdating is True
+        assert not hasattr(app, "Calculation")
+
+
+class TestOpenWorkbook:
+
+    def test_reuses_open_workbook(self, tmp_path):
+        path = tmp_path / "Book.xlsx"
+        wb = SimpleNamespace(FullName=str(path))
+        app = MagicMock()
+        app.Workbooks.__iter__.return_value = iter([wb])
+        assert open_workbook(app, str(path)) is wb
+        app.Workbooks.Open.assert_not_called()
+
+    def test_opens_when_not_open(self, tmp_path):
+        path = tmp_path / "Book.xlsx"
+        app = MagicMock()
+        app.Workbooks.__iter__.return_value = iter([SimpleNamespace(FullName=str(tmp_path / "other.xlsx"))])
+        result = open_workbook(app, path, UpdateLinks=0)
+        app.Workbooks.Open.assert_called_once_with(str(path), UpdateLinks=0)
+        assert result is app.Workbooks.Open.return_value
+
+
+class TestSaveIfDirty:
+
+    def test_skips_clean_workbook(self):
+        wb = MagicMock(Saved=True)
+        assert save_if_dirty(wb) is False
+        wb.Save.assert_not_called()
+
+    def test_saves_dirty_workbook(self):
+        wb = MagicMock(Saved=False)
+        assert save_if_dirty(wb) is True
+        wb.Save.assert_called_once_with()
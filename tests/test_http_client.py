@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+"""http_client.py のユニットテスト"""
+import pytest
+
+pytest.importorskip("requests")
+
+from infra.http_client import get_session  # noqa: E402
+
+
+class TestGetSession:
+
+    def test_session_is_reused_with_retry(self):
+        session = get_session()
+        assert get_session() is session
+        retry = session.get_adapter("https://example.com").max_retries
+        assert retry.total == 3
+        # 読み込みタイムアウトは再試行しない
+        assert (retry.connect, retry.read) == (1, 0)
@@ -79,7 +79,7 @@ class TestAutoTable:
     def setup_method(self):
         self.action = ScrapingAction()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_auto_table_success(self, mock_get):
         mock_resp = MagicMock()
         mock_resp.text = "<html><table><tr><th>A</th></tr><tr><td>1</td></tr><tr><td>2</td></tr><tr><td>3</td></tr></table></html>"
@@ -96,7 +96,7 @@ class TestAutoTable:
 
         assert result.success is True
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_auto_table_no_tables(self, mock_get):
         mock_resp = MagicMock()
         mock_resp.text = "<html><body>no tables</body></html>"
@@ -110,7 +110,7 @@ class TestAutoTable:
         })
         assert result.success is False
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_auto_table_index_out_of_range(self, mock_get):
         mock_resp = MagicMock()
         mock_resp.text = "<html><table><tr><td>1</td></tr></table></html>"
@@ -134,7 +134,7 @@ class TestCssSelector:
     def setup_method(self):
         self.action = ScrapingAction()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_css_selector_success(self, mock_get):
         mock_resp = MagicMock()
         mock_resp.text = """
@@ -159,7 +159,7 @@ class TestCssSelector:
         assert result.success is True
         assert "2行" in result.message
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_css_selector_no_match(self, mock_get):
         mock_resp = MagicMock()
         mock_resp.text = "<html><body></body></html>"
@@ -196,3 +196,17 @@ class TestWriteOutput:
         with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as f:
             self.action._write_output(df, f.name, "Data")
             assert Path(f.name).stat().st_size > 0
+
+
+class TestListCsvPaths:
+    """_list_csv_paths のテスト"""
+
+    def test_lists_only_csv(self, tmp_path):
+        (tmp_path / "a.csv").write_text("x")
+        (tmp_path / "b.CSV").write_text("x")
+        (tmp_path / "c.txt").write_text("x")
+        paths = ScrapingAction._list_csv_paths(str(tmp_path))
+        assert {Path(p).name for p in paths} == {"a.csv", "b.CSV"}
+
+    def test_missing_folder(self, tmp_path):
+        assert ScrapingAction._list_csv_paths(str(tmp_path / "none")) == set()
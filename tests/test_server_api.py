@@ -1,8 +1,11 @@
 # -*- coding: utf-8 -*-
 """server.py API エンドポイントのテスト"""
 import json
+import os
 import tempfile
+import time
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 import yaml
@@ -12,6 +15,7 @@ import actions.scraper  # noqa: F401
 import actions.shell_cmd  # noqa: F401
 import actions.file_ops  # noqa: F401
 
+from core.action_base import ActionResult
 from core.config_manager import ConfigManager
 from web.server import WebServer
 
@@ -108,6 +112,19 @@ class TestScrapePreviewAPI:
                         content_type="application/json")
         assert r.status_code == 400
 
+    @patch("requests.Session.get")
+    def test_auto_table_preview(self, mock_get, client):
+        mock_resp = MagicMock()
+        mock_resp.text = "<html><table><tr><th>A</th></tr><tr><td>1</td></tr></table></html>"
+        mock_get.return_value = mock_resp
+        r = client.post("/api/scrape/preview",
+                        json={"mode": "auto_table", "url": "http://x"},
+                        content_type="application/json")
+        assert r.status_code == 200
+        data = json.loads(r.data)
+        assert data["columns"] == ["A"]
+        assert data["rows"] == [["1"]]
+
 
 class TestTemplatesAPI:
 
@@ -158,6 +175,34 @@ class TestTemplatesAPI:
         r = client.get(f"/api/templates/{tmpl_id}")
         assert r.status_code == 404
 
+    def test_overwrite_template_refreshes_cache(self, client):
+        payload = {"name": "test_cache_tmpl", "description": "v1",
+                   "type": "shell_cmd", "params": {}}
+        r = client.post("/api/templates", json=payload)
+        tmpl_id = json.loads(r.data)["id"]
+        try:
+            r = client.get(f"/api/templates/{tmpl_id}")
+            assert json.loads(r.data)["description"] == "v1"
+
+            payload["description"] = "v2"
+            client.post("/api/templates", json=payload)
+            r = client.get(f"/api/templates/{tmpl_id}")
+            assert json.loads(r.data)["description"] == "v2"
+        finally:
+            client.delete(f"/api/templates/{tmpl_id}")
+
+    def test_outside_edit_with_same_mtime_refreshes_cache(self, tmp_path):
+        server = WebServer(ConfigManager(), port=5099)
+        path = tmp_path / "t.yaml"
+        path.write_text("name: v1\n", encoding="utf-8")
+        st = path.stat()
+        assert server._read_template(path)["name"] == "v1"
+
+        # 同じタイムスタンプのまま外部で書き換えられてもサイズ差で検知する
+        path.write_text("name: v22\n", encoding="utf-8")
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert server._read_template(path)["name"] == "v22"
+
     def test_save_template_without_name(self, client):
         r = client.post("/api/templates",
                         json={"type": "scraper", "params": {}},
@@ -444,6 +489,33 @@ class TestWorkflowAPI:
         # クリーンアップ
         client.delete("/api/workflows/wf_empty")
 
+    def test_run_workflow_stops_before_next_step(self, tmp_path):
+        """中断要求後はワークフローの次のステップに進まない"""
+        config = ConfigManager(config_dir=tmp_path)
+        config.load()
+        for aid in ("s1", "s2"):
+            config.add_action({"id": aid, "name": aid, "type": "shell_cmd",
+                               "params": {"command": "echo ok"}})
+        config.add_workflow({"id": "wf", "name": "WF", "action_ids": ["s1", "s2"],
+                             "stop_on_error": False})
+        server = WebServer(config, port=5099)
+        manager = server.action_manager
+        manager.stop_requested = True  # 前回の中断要求が残っていても開始時にリセットされる
+
+        def run_and_stop(action, notify_start=True):
+            manager.request_stop()
+            return ActionResult(success=False, message="stopped", error="stopped")
+
+        with patch.object(manager, "run_action", side_effect=run_and_stop) as run_action:
+            r = server.app.test_client().post("/api/run/workflow/wf", json={})
+            assert r.status_code == 200
+            for _ in range(100):
+                if server.running_task is None:
+                    break
+                time.sleep(0.05)
+        assert server.running_task is None
+        assert [c.args[0].id for c in run_action.call_args_list] == ["s1"]
+
     def test_run_workflow_nonexistent(self, client):
         r = client.post("/api/run/workflow/nonexistent_xxx",
                         json={},
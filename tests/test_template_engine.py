@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""template_engine 単体テスト"""
+from datetime import datetime
+
+from core.template_engine import expand_params, expand_template, TZ_JST
+
+
+DT_FROM = datetime(2026, 2, 23, tzinfo=TZ_JST)
+DT_TO = datetime(2026, 2, 24, tzinfo=TZ_JST)
+
+
+class TestExpand:
+
+    def test_expand_template(self):
+        text = expand_template("d={from_date}&t={to_date_jp}", dt_from=DT_FROM, dt_to=DT_TO)
+        assert text == "d=2026-02-23&t=20260224"
+
+    def test_expand_template_no_placeholder(self):
+        assert expand_template("plain") == "plain"
+        assert expand_template("") == ""
+
+    def test_expand_params_nested(self):
+        params = {
+            "url": "https://example.com/?from={from_date}",
+            "files": ["{to_date_jp}.csv", 3],
+            "opts": {"name": "{unknown}", "flag": True},
+        }
+        out = expand_params(params, dt_from=DT_FROM, dt_to=DT_TO)
+        assert out["url"] == "https://example.com/?from=2026-02-23"
+        assert out["files"] == ["20260224.csv", 3]
+        assert out["opts"] == {"name": "{unknown}", "flag": True}
+        # 元の辞書は変更しない
+        assert params["files"][0] == "{to_date_jp}.csv"
+
+    def test_expand_params_without_placeholders(self, monkeypatch):
+        import core.template_engine as te
+
+        def fail(**kwargs):
+            raise AssertionError("変数辞書を生成すべきでない")
+        monkeypatch.setattr(te, "get_template_variables", fail)
+        params = {"command": "echo hi", "args": ["a", 1]}
+        out = expand_params(params)
+        assert out == params
+        assert out["args"] is not params["args"]
+
+    def test_first_and_last_day(self):
+        leap = datetime(2024, 2, 10, tzinfo=TZ_JST)
+        text = expand_template("{first_day}..{last_day}", dt_to=leap)
+        assert text == "2024-02-01..2024-02-29"